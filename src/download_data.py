@@ -1,4 +1,7 @@
 import requests
+import shutil
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -7,6 +10,8 @@ class NYCTaxiDataDownloader:
         self.BASE_URL = "https://d37ci6vzurychx.cloudfront.net/trip-data"
         self.YEAR = 2025
         self.DATA_DIR = Path("data/raw")
+        self.CHUNK_SIZE = 1 << 20
+        self.MAX_WORKERS = 12
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     def get_file_path(self, month: int) -> Path:
@@ -28,13 +33,12 @@ class NYCTaxiDataDownloader:
         try:
             with requests.get(url, stream=True) as r:
                 r.raise_for_status()
+                r.raw.decode_content = True
                 with open(file_path, 'wb') as f:
-                    for chunk in r.iter_content():
-                        if chunk:
-                            f.write(chunk)
-            print("Téléchargement terminé ")
+                    shutil.copyfileobj(r.raw, f, length=self.CHUNK_SIZE)
+            print(f"Téléchargement terminé : {file_path.name}")
             return True
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             print(f"Erreur téléchargement de {file_path.name}: {e}")
             if file_path.exists():
                 file_path.unlink()
@@ -44,8 +48,12 @@ class NYCTaxiDataDownloader:
         current_month = 12
         downloaded_files = []
 
-        for month in range(1, current_month + 1):
-            if self.download_month(month):
+        months = range(1, current_month + 1)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = executor.map(self.download_month, months)
+
+        for month, ok in zip(months, results):
+            if ok:
                 downloaded_files.append(self.get_file_path(month).name)
         print("Fichiers téléchargés :")
 